@@ -41,6 +41,10 @@ class Command(ABC):
         """Add a nested command (for control flow commands)."""
         self.nested_commands.append(command)
 
+    def extend_nested(self, commands: list["Command"]) -> None:
+        """Add several nested commands with a single list extend."""
+        self.nested_commands.extend(commands)
+
     def get_nested_commands(self) -> list["Command"]:
         """Get all nested commands."""
         return self.nested_commands
@@ -75,7 +79,10 @@ class CommandRegistry:
         Returns:
             The command class or None if not found
         """
-        return cls._commands.get(name.upper())
+        # Registry keys are canonical upper-case; the parser passes names
+        # it has already upper-cased, so try the token as-is before
+        # paying for another .upper() allocation
+        return cls._commands.get(name) or cls._commands.get(name.upper())
 
     @classmethod
     def create_command(
@@ -91,7 +98,9 @@ class CommandRegistry:
         Returns:
             A command instance or None if not recognized
         """
-        command_class = cls.get_command_class(name)
+        # Inline dict probe rather than going through get_command_class;
+        # this runs once per parsed grid row
+        command_class = cls._commands.get(name) or cls._commands.get(name.upper())
         if command_class:
             command = command_class(grid_position=position)
             command.parse_args(tokens)
@@ -5,9 +5,10 @@ from typing import ClassVar
 from dataclasses import dataclass, field
 from core.types import LogLevel
 
+from ..types import NUMBER_TYPES
 from .base import Command
 from ..context import ExecutionContext
-from ..values import Value, ValueParser, ExpressionParser
+from ..values import Value, ValueParser, ExpressionParser, BooleanValue, NumberValue
 
 
 @dataclass
@@ -18,6 +19,9 @@ class LoopCommand(Command):
 
     # Command-specific attributes
     count_value: Value | None = None
+    # Set at parse time when the count is a literal that can never loop
+    # (FALSE or a non-positive number), so execute can return immediately
+    static_skip: bool = False
 
     def parse_args(self, tokens: list[str]) -> None:
         """Parse LOOP arguments.
@@ -35,8 +39,17 @@ class LoopCommand(Command):
         if not self.count_value:
             raise ValueError(f"Invalid loop count: {tokens[0]}")
 
+        # Constant-fold literal counts that can never execute the body
+        if isinstance(self.count_value, BooleanValue):
+            self.static_skip = not self.count_value.value
+        elif isinstance(self.count_value, NumberValue):
+            self.static_skip = int(self.count_value.value) <= 0
+
     async def execute(self, context: ExecutionContext) -> None:
         """Execute the LOOP command."""
+        if self.static_skip:
+            return
+
         if context.send_message:
             await context.send_message(
                 f"Executing LOOP at {self.grid_position}", LogLevel.DEBUG
@@ -66,12 +79,16 @@ class LoopCommand(Command):
                     # Yield control to allow cancellation
                     await asyncio.sleep(0)
 
+                    # Next iteration must see fresh sensor readings even
+                    # if the body advanced no steps
+                    context.invalidate_sensor_cache()
+
                     # Check for runaway execution
                     if context.steps_executed > context.max_steps:
                         raise RuntimeError("Maximum steps exceeded")
             else:  # FALSE = no loop
                 return
-        elif isinstance(count, (int, float)):
+        elif isinstance(count, NUMBER_TYPES):
             # Fixed count loop
             iterations = int(count)
             for i in range(iterations):
@@ -81,6 +98,10 @@ class LoopCommand(Command):
 
                 # Yield control to allow cancellation
                 await asyncio.sleep(0)
+
+                # Next iteration must see fresh sensor readings even if
+                # the body advanced no steps
+                context.invalidate_sensor_cache()
         else:
             raise ValueError(
                 f"Loop count must be a number or boolean, got {type(count)}"
@@ -146,6 +167,10 @@ class WhileCommand(Command):
             # Yield control to allow cancellation
             await asyncio.sleep(0)
 
+            # The condition must see fresh sensor readings next iteration
+            # even if the body advanced no steps
+            context.invalidate_sensor_cache()
+
             # Check for runaway execution
             if context.steps_executed > context.max_steps:
                 raise RuntimeError("Maximum steps exceeded")
@@ -191,17 +216,22 @@ class IfCommand(Command):
         if not self.condition:
             raise ValueError("IF command has no condition")
 
-        # Evaluate condition
-        if context.send_message:
-            await context.send_message(
-                f"⚙️ IF evaluating condition: {self.condition}", LogLevel.DEBUG
-            )
-        condition_result = await self.condition.evaluate(context)
+        # Literal TRUE/FALSE conditions pick the branch directly without
+        # going through the async evaluator
+        if isinstance(self.condition, BooleanValue):
+            condition_result: bool | float | int | str = self.condition.value
+        else:
+            # Evaluate condition
+            if context.send_message:
+                await context.send_message(
+                    f"⚙️ IF evaluating condition: {self.condition}", LogLevel.DEBUG
+                )
+            condition_result = await self.condition.evaluate(context)
 
-        if context.send_message:
-            await context.send_message(
-                f"🔍 IF condition result: {condition_result}", LogLevel.DEBUG
-            )
+            if context.send_message:
+                await context.send_message(
+                    f"🔍 IF condition result: {condition_result}", LogLevel.DEBUG
+                )
 
         if condition_result:
             # Execute IF block
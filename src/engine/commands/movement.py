@@ -2,6 +2,7 @@ from typing import ClassVar
 from dataclasses import dataclass
 from core.types import LogLevel
 
+from ..types import NUMBER_TYPES
 from .base import Command
 from ..context import ExecutionContext
 from ..values import Value, ValueParser, NumberValue, DirectionValue, ExpressionParser
@@ -51,7 +52,7 @@ class MoveCommand(Command):
             )
 
         distance = await self.distance_value.evaluate(context)
-        if not isinstance(distance, (int, float)):
+        if not isinstance(distance, NUMBER_TYPES):
             raise ValueError(f"Distance must be a number, got {type(distance)}")
 
         if context.send_message:
@@ -137,7 +138,7 @@ class TurnCommand(Command):
         turn_val = await self.direction.evaluate(context)
 
         # Acceptable: number (degrees), or string (LEFT/RIGHT)
-        if isinstance(turn_val, (int, float)):
+        if isinstance(turn_val, NUMBER_TYPES):
             turn_degrees = float(turn_val)
         elif isinstance(turn_val, str):
             turn_val_upper = turn_val.upper()
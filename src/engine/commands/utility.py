@@ -3,6 +3,7 @@ from dataclasses import dataclass
 import asyncio
 from core.types import LogLevel
 
+from ..types import NUMBER_TYPES
 from .base import Command
 from ..context import ExecutionContext
 from ..values import Value, ValueParser
@@ -49,7 +50,7 @@ class WaitCommand(Command):
             )
         time_seconds = await self.time_value.evaluate(context)
 
-        if not isinstance(time_seconds, (int, float)):
+        if not isinstance(time_seconds, NUMBER_TYPES):
             raise ValueError(f"Wait time must be a number, got {type(time_seconds)}")
 
         wait_time = float(time_seconds)
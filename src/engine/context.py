@@ -30,13 +30,13 @@ class SensorInterface(Protocol):
         ...
 
 
+@dataclass(slots=True)
 class MockSensors:
     """Mock sensor implementation for testing."""
 
-    def __init__(self):
-        self.distance = 100.0
-        self.black_detected = False
-        self.obstacle_threshold = 30.0
+    distance: float = 100.0
+    black_detected: bool = False
+    obstacle_threshold: float = 30.0
 
     async def get_distance(self) -> float:
         return self.distance
@@ -51,7 +51,19 @@ class MockSensors:
         return not self.black_detected
 
 
-@dataclass
+# Degree tables for turn tracking, built once at import instead of per call
+_DIRECTION_TO_DEGREES = {
+    Direction.FORWARD: 0,
+    Direction.RIGHT: 90,
+    Direction.BACKWARD: 180,
+    Direction.LEFT: 270,
+}
+_DEGREES_TO_DIRECTION = {
+    degrees: direction for direction, degrees in _DIRECTION_TO_DEGREES.items()
+}
+
+
+@dataclass(slots=True)
 class ExecutionContext:
     """Context that maintains state during program execution."""
 
@@ -80,6 +92,19 @@ class ExecutionContext:
     send_message: Callable[[str, LogLevel], Awaitable[None]] | None = None
     check_cancelled: Callable[[], bool] | None = None
 
+    # When False, per-value evaluation tracing (one message per operand
+    # read and operator application) is skipped entirely, so the hot
+    # expression path neither formats the f-strings nor awaits the
+    # callback. Command-level messages are unaffected.
+    debug_enabled: bool = False
+
+    # Sensor readings cached within a single step (cleared whenever
+    # steps_executed changes, and once per loop iteration) so a condition
+    # that mentions the same sensor twice pays for one hardware
+    # round-trip, not two
+    _sensor_cache: dict[SensorType, Number | bool] = field(default_factory=dict)
+    _sensor_cache_step: int = -1
+
     def get_direction_vector(self) -> Position:
         """Get unit vector for current direction."""
         if self.direction == Direction.FORWARD:
@@ -174,25 +199,15 @@ class ExecutionContext:
             degrees -= 360
 
         # Current direction to degrees
-        current_degrees = {
-            Direction.FORWARD: 0,
-            Direction.RIGHT: 90,
-            Direction.BACKWARD: 180,
-            Direction.LEFT: 270,
-        }[self.direction]
+        current_degrees = _DIRECTION_TO_DEGREES[self.direction]
 
         # Calculate new direction
         new_degrees = (current_degrees + degrees) % 360
 
         # Convert back to Direction
-        if new_degrees == 0:
-            self.direction = Direction.FORWARD
-        elif new_degrees == 90:
-            self.direction = Direction.RIGHT
-        elif new_degrees == 180:
-            self.direction = Direction.BACKWARD
-        elif new_degrees == 270:
-            self.direction = Direction.LEFT
+        exact_direction = _DEGREES_TO_DIRECTION.get(new_degrees)
+        if exact_direction is not None:
+            self.direction = exact_direction
         else:
             # For non-90 degree turns, pick closest cardinal direction
             if 315 <= new_degrees or new_degrees < 45:
@@ -226,8 +241,29 @@ class ExecutionContext:
         """Get a variable value, defaulting to 0 if not set."""
         return self.variables.get(name, 0)
 
+    def invalidate_sensor_cache(self) -> None:
+        """Drop cached sensor readings so the next read hits the sensor.
+
+        Loops call this once per iteration: a polling loop whose body
+        executes no step-advancing command would otherwise spin forever
+        on the first cached reading.
+        """
+        self._sensor_cache.clear()
+
     async def get_sensor_value(self, sensor_type: SensorType) -> Number | bool:
-        """Get sensor reading."""
+        """Get sensor reading.
+
+        Readings are memoized per step: repeated reads of the same sensor
+        within one step return the cached value, and the cache is
+        invalidated as soon as steps_executed advances or a loop starts a
+        new iteration (see invalidate_sensor_cache).
+        """
+        if self._sensor_cache_step != self.steps_executed:
+            self._sensor_cache.clear()
+            self._sensor_cache_step = self.steps_executed
+        elif sensor_type in self._sensor_cache:
+            return self._sensor_cache[sensor_type]
+
         # Use hardware interface if available, otherwise fall back to legacy sensors
         if self.hardware:
             if sensor_type == SensorType.DISTANCE:
@@ -253,6 +289,8 @@ class ExecutionContext:
             else:
                 value = 0
 
+        self._sensor_cache[sensor_type] = value
+
         if self.send_message:
             await self.send_message(
                 f"📡 Sensor {sensor_type.value} reading: {value} (type: {type(value).__name__})",
@@ -8,6 +8,40 @@ from core import CarAPIClient, config
 logger = logging.getLogger(__name__)
 
 
+def _coerce_distance(result, success: bool) -> float:
+    """Coerce a distance-sensor API result to cm, falling back to 999.0.
+
+    The ESP32 may return the reading as a number or a string; anything
+    unconvertible (or a failed call) yields the fallback value.
+    """
+    if success:
+        try:
+            return float(result)
+        except (ValueError, TypeError):
+            logger.warning(
+                f"📏 Distance sensor - could not convert result '{result}' to float, using fallback"
+            )
+    else:
+        logger.warning("📏 Distance sensor - API call failed, using fallback")
+    return 999.0
+
+
+def _coerce_black(result, success: bool) -> bool:
+    """Coerce an IR-sensor API result ('1'/'0') to a bool, falling back to False."""
+    if success and isinstance(result, str):
+        if result == "1":
+            return True
+        if result != "0":
+            logger.warning(
+                f"⚫ IR sensor - unexpected string result '{result}', returning False"
+            )
+        return False
+    logger.warning(
+        "⚫ IR sensor - API call failed or invalid result type, returning False"
+    )
+    return False
+
+
 class HardwareInterface(Protocol):
     """Protocol for hardware interface implementations."""
 
@@ -162,31 +196,9 @@ class CarHardware:
             action="distance",
         )
 
-        logger.debug(
-            f"📏 Distance sensor - success: {success}, result: {result}, type: {type(result).__name__}"
-        )
-
-        if success and isinstance(result, (int, float)):
-            distance = float(result)
-            logger.debug(f"📏 Distance sensor returning: {distance}cm")
-            return distance
-        elif success:
-            # Try to convert string to float (in case ESP32 returns string)
-            try:
-                distance = float(result)  # type: ignore[arg-type]
-                logger.debug(
-                    f"📏 Distance sensor (converted from string): {distance}cm"
-                )
-                return distance
-            except (ValueError, TypeError):
-                logger.warning(
-                    f"📏 Distance sensor - could not convert result '{result}' to float, using fallback"
-                )
-        else:
-            logger.warning("📏 Distance sensor - API call failed, using fallback")
-
-        logger.warning("📏 Distance sensor returning fallback value: 999.0cm")
-        return 999.0
+        distance = _coerce_distance(result, success)
+        logger.debug(f"📏 Distance sensor returning: {distance}cm")
+        return distance
 
     async def is_obstacle_detected(self, threshold_cm: float = 15.0) -> bool:
         """Check if obstacle is detected within threshold."""
@@ -204,27 +216,9 @@ class CarHardware:
             "Reading IR sensor",
         )
 
-        logger.debug(
-            f"⚫ IR sensor - success: {success}, result: {result}, type: {type(result).__name__}"
-        )
-
-        if success and isinstance(result, str):
-            if result == "1":
-                logger.debug("⚫ IR sensor returning True (from '1')")
-                return True
-            elif result == "0":
-                logger.debug("⚫ IR sensor returning False (from '0')")
-                return False
-            else:
-                logger.warning(
-                    f"⚫ IR sensor - unexpected string result '{result}', returning False"
-                )
-                return False
-        else:
-            logger.warning(
-                "⚫ IR sensor - API call failed or invalid result type, returning False"
-            )
-            return False
+        is_black = _coerce_black(result, success)
+        logger.debug(f"⚫ IR sensor returning: {is_black}")
+        return is_black
 
     async def control_buzzer(self, action: str) -> bool:
         """Control the buzzer."""
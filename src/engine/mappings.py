@@ -6,6 +6,8 @@ for commands and values that get replaced with their canonical names
 before parsing begins.
 """
 
+from typing import Sequence
+
 # Global mapping dictionary for alternative names
 # Key: alternative name (what users might type)
 # Value: canonical name (what the parser expects)
@@ -18,7 +20,7 @@ COMMAND_MAPPINGS = {
 }
 
 
-def preprocess_grid(grid: list[list[str]]) -> list[list[str]]:
+def preprocess_grid(grid: Sequence[Sequence[str]]) -> list[Sequence[str]]:
     """
     Preprocess the grid to replace alternative names with canonical names.
 
@@ -29,20 +31,24 @@ def preprocess_grid(grid: list[list[str]]) -> list[list[str]]:
         New grid with mapped strings replaced with canonical names
     """
     if not grid:
-        return grid
+        return list(grid)
 
-    # Create a deep copy to avoid modifying the original grid
-    processed_grid = []
+    processed_grid: list[Sequence[str]] = []
 
     for row in grid:
-        processed_row = []
-        for cell in row:
-            if not cell or not cell.strip():
-                processed_row.append(cell)
+        # Copy-on-write: most rows contain no mapped names, so only allocate
+        # a new row list once a cell actually needs replacing. Untouched rows
+        # are shared with the input grid (cells are never mutated in place).
+        processed_row: list[str] | None = None
+
+        for col_idx, cell in enumerate(row):
+            # Strip and lowercase once per cell - the mapping lookup and the
+            # case-style checks below all work from these
+            stripped = cell.strip() if cell else ""
+            if not stripped:
                 continue
 
-            # Get the stripped cell content for lookup
-            cell_content = cell.strip().lower()
+            cell_content = stripped.lower()
 
             # Check if this cell content has a mapping
             if cell_content in COMMAND_MAPPINGS:
@@ -53,9 +59,9 @@ def preprocess_grid(grid: list[list[str]]) -> list[list[str]]:
                 # If original was all caps, make canonical all caps
                 # If original was title case, make canonical title case
                 # Otherwise use canonical as-is
-                if cell.strip().isupper():
+                if stripped.isupper():
                     processed_cell = canonical.upper()
-                elif cell.strip().istitle():
+                elif stripped.istitle():
                     processed_cell = canonical.title()
                 else:
                     processed_cell = canonical
@@ -67,12 +73,11 @@ def preprocess_grid(grid: list[list[str]]) -> list[list[str]]:
                     (" " * leading_space) + processed_cell + (" " * trailing_space)
                 )
 
-                processed_row.append(processed_cell)
-            else:
-                # No mapping found, keep original
-                processed_row.append(cell)
+                if processed_row is None:
+                    processed_row = list(row)
+                processed_row[col_idx] = processed_cell
 
-        processed_grid.append(processed_row)
+        processed_grid.append(processed_row if processed_row is not None else row)
 
     return processed_grid
 
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
-from typing import cast
+from typing import Sequence, cast
 
 from .types import GridPosition
 from .commands import Command, CommandRegistry, IfCommand, ElseCommand
 from .mappings import preprocess_grid
 
 
-@dataclass
+@dataclass(slots=True)
 class GridToken:
     """A token from the grid with its position."""
 
@@ -27,11 +27,12 @@ class GridParser:
     at a column position greater than 0 (e.g., for loops and conditionals).
     """
 
-    def __init__(self, grid: list[list[str]]):
+    def __init__(self, grid: Sequence[Sequence[str]]):
         """Initialize parser with a 2D grid.
 
         Args:
-            grid: 2D list of strings representing the programming blocks
+            grid: 2D grid of strings (any sequence of rows) representing
+                the programming blocks
         """
         # Apply command mappings preprocessing before parsing
         self.grid = preprocess_grid(grid)
@@ -45,53 +46,70 @@ class GridParser:
             List of Command objects representing the program
         """
         commands = []
-        stack: list[tuple[int, Command]] = []  # (column, command) for nesting
+        # Parallel stacks for nesting - avoids packing/unpacking a tuple on
+        # every push/pop and keeps the hot indentation check on a plain int
+        stack_cols: list[int] = []
+        stack_cmds: list[Command] = []
         in_else_block = False
         else_if_command: IfCommand | None = None
 
         # Process each row
-        for row_idx in range(self.rows):
-            if row_idx >= len(self.grid):
-                continue
-
-            # Find the first non-empty cell in this row
+        for row_idx, row in enumerate(self.grid):
+            # Find the first non-empty cell in this row, keeping the
+            # stripped text so it isn't re-stripped below
             first_col = -1
-            for col_idx in range(len(self.grid[row_idx])):
-                if self.grid[row_idx][col_idx].strip():
+            first_text = ""
+            for col_idx, cell in enumerate(row):
+                stripped = cell.strip()
+                if stripped:
                     first_col = col_idx
+                    first_text = stripped
                     break
 
             if first_col == -1:  # Empty row
                 continue
 
+            # Normalize the command name once - it's needed in the pop loop
+            # below and again when creating the command
+            command_name = first_text.upper()
+
             # Pop from stack if we're at same or lesser indentation
-            # BUT don't pop IF commands if the current command is ELSE at same level
-            while stack and stack[-1][0] >= first_col:
-                # Special case: don't pop IF if current command is ELSE at same level
-                if (
-                    self.grid[row_idx][first_col].strip().upper() == "ELSE"
-                    and stack[-1][0] == first_col
-                    and isinstance(stack[-1][1], IfCommand)
-                ):
-                    break
+            # BUT don't pop IF commands if the current command is ELSE at same level.
+            # The ELSE check only matters for ELSE rows, so the common case gets
+            # a tight loop without it.
+            if command_name == "ELSE":
+                while stack_cols and stack_cols[-1] >= first_col:
+                    # Special case: don't pop IF if ELSE is at the same level
+                    if stack_cols[-1] == first_col and isinstance(
+                        stack_cmds[-1], IfCommand
+                    ):
+                        break
 
-                popped = stack.pop()
-                # If we're popping an ELSE marker, we're leaving the ELSE block
-                if isinstance(popped[1], ElseCommand):
-                    in_else_block = False
-                    else_if_command = None
+                    stack_cols.pop()
+                    popped = stack_cmds.pop()
+                    # If we're popping an ELSE marker, we're leaving the ELSE block
+                    if isinstance(popped, ElseCommand):
+                        in_else_block = False
+                        else_if_command = None
+            else:
+                while stack_cols and stack_cols[-1] >= first_col:
+                    stack_cols.pop()
+                    popped = stack_cmds.pop()
+                    # If we're popping an ELSE marker, we're leaving the ELSE block
+                    if isinstance(popped, ElseCommand):
+                        in_else_block = False
+                        else_if_command = None
 
-            # Parse the command starting from first_col
-            command_name = self.grid[row_idx][first_col].strip().upper()
             args = []
 
             # Collect arguments from subsequent cells in the same row
-            for col_idx in range(first_col + 1, len(self.grid[row_idx])):
-                arg_text = self.grid[row_idx][col_idx].strip()
+            for arg_cell in row[first_col + 1 :]:
+                arg_text = arg_cell.strip()
                 if arg_text:
                     # Stop if we hit another command (but ELSE is not a stopper)
-                    if arg_text.upper() != "ELSE" and CommandRegistry.get_command_class(
-                        arg_text.upper()
+                    arg_upper = arg_text.upper()
+                    if arg_upper != "ELSE" and CommandRegistry.get_command_class(
+                        arg_upper
                     ):
                         break
                     args.append(arg_text)
@@ -110,13 +128,14 @@ class GridParser:
             if isinstance(command, ElseCommand):
                 # Find the matching IF command
                 found_if = False
-                for i in range(len(stack) - 1, -1, -1):
-                    if isinstance(stack[i][1], IfCommand):
-                        else_if_command = cast(IfCommand, stack[i][1])
+                for i in range(len(stack_cmds) - 1, -1, -1):
+                    if isinstance(stack_cmds[i], IfCommand):
+                        else_if_command = cast(IfCommand, stack_cmds[i])
                         in_else_block = True
                         found_if = True
                         # Push ELSE marker onto stack
-                        stack.append((first_col, command))
+                        stack_cols.append(first_col)
+                        stack_cmds.append(command)
                         break
 
                 if not found_if:
@@ -126,16 +145,16 @@ class GridParser:
                 continue  # Don't add ELSE as a command
 
             # Add to parent or top level
-            if stack and first_col > stack[-1][0]:
+            if stack_cols and first_col > stack_cols[-1]:
                 # This is nested under the previous command on the stack
-                parent = stack[-1][1]
+                parent = stack_cmds[-1]
                 if isinstance(parent, ElseCommand):
                     # We're in an ELSE block - add to the IF's else commands
                     if in_else_block and else_if_command:
                         else_if_command.add_else_command(command)
                 else:
                     parent.add_nested_command(command)
-            elif in_else_block and else_if_command and stack:
+            elif in_else_block and else_if_command and stack_cols:
                 # We're at the same level in an ELSE block - add to the IF's else commands
                 else_if_command.add_else_command(command)
             else:
@@ -144,7 +163,8 @@ class GridParser:
 
             # Push onto stack if it can have nested commands
             if hasattr(command, "nested_commands"):
-                stack.append((first_col, command))
+                stack_cols.append(first_col)
+                stack_cmds.append(command)
 
         return commands
 
@@ -0,0 +1,45 @@
+"""Shared fixtures for engine tests."""
+
+import pytest
+
+from core import MockCarAPIClient
+
+from ..hardware import CarHardware, MockHardware
+
+
+class MessageCapture:
+    """Message callback that records everything it is sent.
+
+    Passed wherever a send_message callback is expected; captured
+    messages are available on the .messages list.
+    """
+
+    def __init__(self):
+        self.messages = []
+
+    async def __call__(self, msg, level):
+        self.messages.append(msg)
+
+
+@pytest.fixture
+def capture_messages():
+    """A reusable send_message callback that collects messages."""
+    return MessageCapture()
+
+
+@pytest.fixture
+def mock_hardware():
+    """A fresh MockHardware with empty movement/rotation history."""
+    return MockHardware()
+
+
+@pytest.fixture
+def mock_car_api():
+    """A MockCarAPIClient with default readings."""
+    return MockCarAPIClient()
+
+
+@pytest.fixture
+def car_hardware(mock_car_api):
+    """CarHardware wired to the mock_car_api client."""
+    return CarHardware(api_client=mock_car_api)
@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+import time
 from unittest.mock import AsyncMock
 
 from engine.commands.movement import MoveCommand
@@ -75,8 +76,8 @@ class TestAsyncIOCancellation:
         context = ExecutionContext()
         context.send_message = AsyncMock()
 
-        # Time the cancellation
-        start_time = asyncio.get_event_loop().time()
+        # Time the cancellation on the monotonic clock
+        start_time = time.perf_counter()
 
         task = asyncio.create_task(wait_cmd.execute(context))
 
@@ -87,8 +88,7 @@ class TestAsyncIOCancellation:
         with pytest.raises(asyncio.CancelledError):
             await task
 
-        end_time = asyncio.get_event_loop().time()
-        elapsed = end_time - start_time
+        elapsed = time.perf_counter() - start_time
 
         # Should be cancelled quickly, not wait the full 5 seconds
         assert elapsed < 1.0, f"Cancellation took too long: {elapsed}s"
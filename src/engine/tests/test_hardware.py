@@ -4,7 +4,7 @@ import pytest
 from unittest.mock import Mock, AsyncMock
 
 from ..hardware import CarHardware, MockHardware
-from core import MockCarAPIClient, CarResponse
+from core import CarResponse
 
 
 @pytest.mark.asyncio
@@ -125,18 +125,14 @@ async def test_mock_hardware_reset():
 
 
 @pytest.mark.asyncio
-async def test_car_hardware_successful_movement():
+async def test_car_hardware_successful_movement(car_hardware):
     """Test CarHardware with successful API responses."""
-    # Create mock API client
-    mock_api = MockCarAPIClient()
-    hardware = CarHardware(api_client=mock_api)
-
     # Test forward movement
-    success = await hardware.move_distance(15.0)
+    success = await car_hardware.move_distance(15.0)
     assert success is True
 
     # Test backward movement
-    success = await hardware.move_distance(-10.0)
+    success = await car_hardware.move_distance(-10.0)
     assert success is True
 
 
@@ -157,13 +153,10 @@ async def test_car_hardware_failed_movement():
 
 
 @pytest.mark.asyncio
-async def test_car_hardware_successful_rotation():
+async def test_car_hardware_successful_rotation(car_hardware):
     """Test CarHardware rotation with successful API response."""
-    mock_api = MockCarAPIClient()
-    hardware = CarHardware(api_client=mock_api)
-
     # Test rotation
-    success = await hardware.rotate_degrees(90.0)
+    success = await car_hardware.rotate_degrees(90.0)
     assert success is True
 
 
@@ -183,17 +176,14 @@ async def test_car_hardware_failed_rotation():
 
 
 @pytest.mark.asyncio
-async def test_car_hardware_pen_control():
+async def test_car_hardware_pen_control(car_hardware):
     """Test CarHardware pen control."""
-    mock_api = MockCarAPIClient()
-    hardware = CarHardware(api_client=mock_api)
-
     # Test pen down
-    success = await hardware.set_pen_down(True)
+    success = await car_hardware.set_pen_down(True)
     assert success is True
 
     # Test pen up
-    success = await hardware.set_pen_down(False)
+    success = await car_hardware.set_pen_down(False)
     assert success is True
 
 
@@ -213,15 +203,12 @@ async def test_car_hardware_failed_pen_control():
 
 
 @pytest.mark.asyncio
-async def test_car_hardware_distance_sensor():
+async def test_car_hardware_distance_sensor(mock_car_api, car_hardware):
     """Test CarHardware distance sensor."""
-    mock_api = MockCarAPIClient()
     # Set a specific distance reading
-    mock_api.distance_reading = 25.5
+    mock_car_api.distance_reading = 25.5
 
-    hardware = CarHardware(api_client=mock_api)
-
-    distance = await hardware.get_distance_cm()
+    distance = await car_hardware.get_distance_cm()
     assert distance == 25.5
 
 
@@ -240,20 +227,17 @@ async def test_car_hardware_failed_distance_sensor():
 
 
 @pytest.mark.asyncio
-async def test_car_hardware_obstacle_detection():
+async def test_car_hardware_obstacle_detection(mock_car_api, car_hardware):
     """Test CarHardware obstacle detection."""
-    mock_api = MockCarAPIClient()
     # Set distance that will trigger obstacle detection
-    mock_api.distance_reading = 10.0
-
-    hardware = CarHardware(api_client=mock_api)
+    mock_car_api.distance_reading = 10.0
 
     # Test with default threshold (15cm)
-    is_obstacle = await hardware.is_obstacle_detected()
+    is_obstacle = await car_hardware.is_obstacle_detected()
     assert is_obstacle is True  # 10 < 15
 
     # Test with custom threshold
-    is_obstacle = await hardware.is_obstacle_detected(threshold_cm=20.0)
+    is_obstacle = await car_hardware.is_obstacle_detected(threshold_cm=20.0)
     assert is_obstacle is True  # 10 < 20
 
 
@@ -272,14 +256,11 @@ async def test_car_hardware_failed_obstacle_detection():
 
 
 @pytest.mark.asyncio
-async def test_car_hardware_black_detection():
+async def test_car_hardware_black_detection(mock_car_api, car_hardware):
     """Test CarHardware black surface detection."""
-    mock_api = MockCarAPIClient()
-    mock_api.black_detected = True
-
-    hardware = CarHardware(api_client=mock_api)
+    mock_car_api.black_detected = True
 
-    is_black = await hardware.is_black_detected()
+    is_black = await car_hardware.is_black_detected()
     assert is_black is True
 
 
@@ -3,20 +3,14 @@
 import pytest
 
 from ..workflow import engine_workflow
-from ..hardware import MockHardware
 from ..executor import Executor
 from ..commands import CommandRegistry
 from ..types import GridPosition
 
 
 @pytest.mark.asyncio
-async def test_engine_workflow_with_mock_hardware():
+async def test_engine_workflow_with_mock_hardware(capture_messages):
     """Test complete engine workflow using mock hardware."""
-    messages = []
-
-    async def capture_messages(msg, level):
-        messages.append(msg)
-
     # Simple movement grid
     grid = [
         ["MOVE", "10", ""],
@@ -37,16 +31,9 @@ async def test_engine_workflow_with_mock_hardware():
 
 
 @pytest.mark.asyncio
-async def test_hardware_integration_movement_tracking():
+async def test_hardware_integration_movement_tracking(capture_messages, mock_hardware):
     """Test that hardware interface tracks actual movements."""
-    messages = []
-
-    async def capture_messages(msg, level):
-        messages.append(msg)
-
-    # Create mock hardware
-    hardware = MockHardware()
-    executor = Executor(capture_messages, hardware=hardware)
+    executor = Executor(capture_messages, hardware=mock_hardware)
 
     # Execute movement commands
     commands = [
@@ -61,7 +48,7 @@ async def test_hardware_integration_movement_tracking():
     await executor.execute(valid_commands)
 
     # Check hardware movements (distances directly in cm)
-    assert hardware.total_distance_moved == 23.0  # (15 + 8) cm
-    assert len(hardware.movement_history) == 2
-    assert hardware.movement_history[0] == 15.0  # 15cm
-    assert hardware.movement_history[1] == 8.0  # 8cm
+    assert mock_hardware.total_distance_moved == 23.0  # (15 + 8) cm
+    assert len(mock_hardware.movement_history) == 2
+    assert mock_hardware.movement_history[0] == 15.0  # 15cm
+    assert mock_hardware.movement_history[1] == 8.0  # 8cm
@@ -9,34 +9,136 @@ from ..types import GridPosition
 from ..parser import GridParser
 
 
+# Outer IF TRUE -> Middle IF TRUE -> Inner IF TRUE
+GRID_NESTED_ALL_TRUE = (
+    ("SET", "A", "10"),  # Row 0: A = 10
+    ("SET", "B", "5"),  # Row 1: B = 5
+    ("SET", "C", "3"),  # Row 2: C = 3
+    ("IF", "A", ">", "5"),  # Row 3: Outer IF (10 > 5 = TRUE)
+    ("", "MOVE", "1"),  # Row 4:   Move 1 (outer then)
+    ("", "IF", "B", ">", "3"),  # Row 5:   Middle IF (5 > 3 = TRUE)
+    ("", "", "MOVE", "2"),  # Row 6:     Move 2 (middle then)
+    ("", "", "IF", "C", ">", "2"),  # Row 7:     Inner IF (3 > 2 = TRUE)
+    ("", "", "", "MOVE", "3"),  # Row 8:       Move 3 (inner then)
+    ("", "", "ELSE"),  # Row 9:     Inner ELSE
+    ("", "", "", "MOVE", "-3"),  # Row 10:      Move -3 (inner else)
+    ("", "ELSE"),  # Row 11:   Middle ELSE
+    ("", "", "MOVE", "-2"),  # Row 12:     Move -2 (middle else)
+    ("ELSE",),  # Row 13: Outer ELSE
+    ("", "MOVE", "-1"),  # Row 14:   Move -1 (outer else)
+)
+
+# Outer IF FALSE -> should only execute outer ELSE
+GRID_NESTED_OUTER_FALSE = (
+    ("SET", "A", "2"),  # Row 0: A = 2
+    ("SET", "B", "5"),  # Row 1: B = 5
+    ("SET", "C", "3"),  # Row 2: C = 3
+    ("IF", "A", ">", "5"),  # Row 3: Outer IF (2 > 5 = FALSE)
+    ("", "MOVE", "1"),  # Row 4:   Move 1 (outer then) - NOT EXECUTED
+    ("", "IF", "B", ">", "3"),  # Row 5:   Middle IF - NOT EXECUTED
+    ("", "", "MOVE", "2"),  # Row 6:     Move 2 - NOT EXECUTED
+    ("", "", "IF", "C", ">", "2"),  # Row 7:     Inner IF - NOT EXECUTED
+    ("", "", "", "MOVE", "3"),  # Row 8:       Move 3 - NOT EXECUTED
+    ("", "", "ELSE"),  # Row 9:     Inner ELSE - NOT EXECUTED
+    ("", "", "", "MOVE", "-3"),  # Row 10:      Move -3 - NOT EXECUTED
+    ("", "ELSE"),  # Row 11:   Middle ELSE - NOT EXECUTED
+    ("", "", "MOVE", "-2"),  # Row 12:     Move -2 - NOT EXECUTED
+    ("ELSE",),  # Row 13: Outer ELSE
+    ("", "MOVE", "-1"),  # Row 14:   Move -1 (outer else) - EXECUTED
+)
+
+# Outer IF TRUE -> Middle IF FALSE -> Middle ELSE
+GRID_NESTED_MIDDLE_FALSE = (
+    ("SET", "A", "10"),  # Row 0: A = 10
+    ("SET", "B", "2"),  # Row 1: B = 2
+    ("SET", "C", "3"),  # Row 2: C = 3
+    ("IF", "A", ">", "5"),  # Row 3: Outer IF (10 > 5 = TRUE)
+    ("", "MOVE", "1"),  # Row 4:   Move 1 (outer then)
+    ("", "IF", "B", ">", "3"),  # Row 5:   Middle IF (2 > 3 = FALSE)
+    ("", "", "MOVE", "2"),  # Row 6:     Move 2 (middle then) - NOT EXECUTED
+    ("", "", "IF", "C", ">", "2"),  # Row 7:     Inner IF - NOT EXECUTED
+    ("", "", "", "MOVE", "3"),  # Row 8:       Move 3 - NOT EXECUTED
+    ("", "", "ELSE"),  # Row 9:     Inner ELSE - NOT EXECUTED
+    ("", "", "", "MOVE", "-3"),  # Row 10:      Move -3 - NOT EXECUTED
+    ("", "ELSE"),  # Row 11:   Middle ELSE
+    ("", "", "MOVE", "-2"),  # Row 12:     Move -2 (middle else)
+    ("ELSE",),  # Row 13: Outer ELSE - NOT EXECUTED
+    ("", "MOVE", "-1"),  # Row 14:   Move -1 - NOT EXECUTED
+)
+
+# Outer IF TRUE -> Middle IF TRUE -> Inner IF FALSE -> Inner ELSE
+GRID_NESTED_INNER_FALSE = (
+    ("SET", "A", "10"),  # Row 0: A = 10
+    ("SET", "B", "5"),  # Row 1: B = 5
+    ("SET", "C", "1"),  # Row 2: C = 1
+    ("IF", "A", ">", "5"),  # Row 3: Outer IF (10 > 5 = TRUE)
+    ("", "MOVE", "1"),  # Row 4:   Move 1 (outer then)
+    ("", "IF", "B", ">", "3"),  # Row 5:   Middle IF (5 > 3 = TRUE)
+    ("", "", "MOVE", "2"),  # Row 6:     Move 2 (middle then)
+    ("", "", "IF", "C", ">", "2"),  # Row 7:     Inner IF (1 > 2 = FALSE)
+    ("", "", "", "MOVE", "3"),  # Row 8:       Move 3 (inner then) - NOT EXECUTED
+    ("", "", "ELSE"),  # Row 9:     Inner ELSE
+    ("", "", "", "MOVE", "-3"),  # Row 10:      Move -3 (inner else)
+    ("", "ELSE"),  # Row 11:   Middle ELSE - NOT EXECUTED
+    ("", "", "MOVE", "-2"),  # Row 12:     Move -2 - NOT EXECUTED
+    ("ELSE",),  # Row 13: Outer ELSE - NOT EXECUTED
+    ("", "MOVE", "-1"),  # Row 14:   Move -1 - NOT EXECUTED
+)
+
+# Test that variables are properly modified in the correct branches
+GRID_NESTED_VARIABLES = (
+    ("SET", "RESULT", "0"),  # Row 0: RESULT = 0
+    ("SET", "A", "10"),  # Row 1: A = 10
+    ("SET", "B", "5"),  # Row 2: B = 5
+    ("SET", "C", "3"),  # Row 3: C = 3
+    ("IF", "A", ">", "5"),  # Row 4: Outer IF (10 > 5 = TRUE)
+    ("", "SET", "RESULT", "RESULT", "+", "100"),  # Row 5:   RESULT += 100
+    ("", "IF", "B", ">", "3"),  # Row 6:   Middle IF (5 > 3 = TRUE)
+    ("", "", "SET", "RESULT", "RESULT", "+", "10"),  # Row 7:     RESULT += 10
+    ("", "", "IF", "C", ">", "2"),  # Row 8:     Inner IF (3 > 2 = TRUE)
+    ("", "", "", "SET", "RESULT", "RESULT", "+", "1"),  # Row 9:       RESULT += 1
+    ("", "", "ELSE"),  # Row 10:    Inner ELSE
+    ("", "", "", "SET", "RESULT", "RESULT", "-", "1"),  # Row 11:      RESULT -= 1
+    ("", "ELSE"),  # Row 12:   Middle ELSE
+    ("", "", "SET", "RESULT", "RESULT", "-", "10"),  # Row 13:     RESULT -= 10
+    ("ELSE",),  # Row 14: Outer ELSE
+    ("", "SET", "RESULT", "RESULT", "-", "100"),  # Row 15:   RESULT -= 100
+)
+
+GRID_NESTED_PARSE_STRUCTURE = (
+    ("IF", "TRUE"),  # Row 0: Outer IF
+    ("", "MOVE", "1"),  # Row 1:   Outer then
+    ("", "IF", "TRUE"),  # Row 2:   Middle IF
+    ("", "", "MOVE", "2"),  # Row 3:     Middle then
+    ("", "", "IF", "TRUE"),  # Row 4:     Inner IF
+    ("", "", "", "MOVE", "3"),  # Row 5:       Inner then
+    ("", "", "ELSE"),  # Row 6:     Inner ELSE
+    ("", "", "", "MOVE", "-3"),  # Row 7:       Inner else
+    ("", "ELSE"),  # Row 8:   Middle ELSE
+    ("", "", "MOVE", "-2"),  # Row 9:     Middle else
+    ("ELSE",),  # Row 10: Outer ELSE
+    ("", "MOVE", "-1"),  # Row 11:   Outer else
+)
+
+GRID_NESTED_WITH_LOOPS = (
+    ("SET", "COUNT", "0"),  # Row 0: COUNT = 0
+    ("IF", "TRUE"),  # Row 1: Outer IF
+    ("", "LOOP", "2"),  # Row 2:   Loop 2 times
+    ("", "", "IF", "COUNT", "<", "1"),  # Row 3:     Inner IF
+    ("", "", "", "MOVE", "1"),  # Row 4:       Move 1
+    ("", "", "", "SET", "COUNT", "COUNT", "+", "1"),  # Row 5:  COUNT++
+    ("", "", "ELSE"),  # Row 6:     Inner ELSE
+    ("", "", "", "MOVE", "2"),  # Row 7:       Move 2
+    ("ELSE",),  # Row 8: Outer ELSE
+    ("", "MOVE", "-5"),  # Row 9:   Move -5
+)
+
+
 @pytest.mark.asyncio
-async def test_triple_nested_if_else_all_true():
+async def test_triple_nested_if_else_all_true(capture_messages):
     """Test 3 nested IF-ELSE with all conditions TRUE."""
-    messages = []
-
-    async def capture_messages(msg, level):
-        messages.append(msg)
-
-    # Outer IF TRUE -> Middle IF TRUE -> Inner IF TRUE
-    grid = [
-        ["SET", "A", "10"],  # Row 0: A = 10
-        ["SET", "B", "5"],  # Row 1: B = 5
-        ["SET", "C", "3"],  # Row 2: C = 3
-        ["IF", "A", ">", "5"],  # Row 3: Outer IF (10 > 5 = TRUE)
-        ["", "MOVE", "1"],  # Row 4:   Move 1 (outer then)
-        ["", "IF", "B", ">", "3"],  # Row 5:   Middle IF (5 > 3 = TRUE)
-        ["", "", "MOVE", "2"],  # Row 6:     Move 2 (middle then)
-        ["", "", "IF", "C", ">", "2"],  # Row 7:     Inner IF (3 > 2 = TRUE)
-        ["", "", "", "MOVE", "3"],  # Row 8:       Move 3 (inner then)
-        ["", "", "ELSE"],  # Row 9:     Inner ELSE
-        ["", "", "", "MOVE", "-3"],  # Row 10:      Move -3 (inner else)
-        ["", "ELSE"],  # Row 11:   Middle ELSE
-        ["", "", "MOVE", "-2"],  # Row 12:     Move -2 (middle else)
-        ["ELSE"],  # Row 13: Outer ELSE
-        ["", "MOVE", "-1"],  # Row 14:   Move -1 (outer else)
-    ]
-
-    result = await engine_workflow(capture_messages, grid)
+
+    result = await engine_workflow(capture_messages, GRID_NESTED_ALL_TRUE)
 
     assert result["success"] is True
     # Should execute: MOVE 1, MOVE 2, MOVE 3
@@ -48,33 +150,10 @@ async def test_triple_nested_if_else_all_true():
 
 
 @pytest.mark.asyncio
-async def test_triple_nested_if_else_outer_false():
+async def test_triple_nested_if_else_outer_false(capture_messages):
     """Test 3 nested IF-ELSE with outer condition FALSE."""
-    messages = []
-
-    async def capture_messages(msg, level):
-        messages.append(msg)
-
-    # Outer IF FALSE -> should only execute outer ELSE
-    grid = [
-        ["SET", "A", "2"],  # Row 0: A = 2
-        ["SET", "B", "5"],  # Row 1: B = 5
-        ["SET", "C", "3"],  # Row 2: C = 3
-        ["IF", "A", ">", "5"],  # Row 3: Outer IF (2 > 5 = FALSE)
-        ["", "MOVE", "1"],  # Row 4:   Move 1 (outer then) - NOT EXECUTED
-        ["", "IF", "B", ">", "3"],  # Row 5:   Middle IF - NOT EXECUTED
-        ["", "", "MOVE", "2"],  # Row 6:     Move 2 - NOT EXECUTED
-        ["", "", "IF", "C", ">", "2"],  # Row 7:     Inner IF - NOT EXECUTED
-        ["", "", "", "MOVE", "3"],  # Row 8:       Move 3 - NOT EXECUTED
-        ["", "", "ELSE"],  # Row 9:     Inner ELSE - NOT EXECUTED
-        ["", "", "", "MOVE", "-3"],  # Row 10:      Move -3 - NOT EXECUTED
-        ["", "ELSE"],  # Row 11:   Middle ELSE - NOT EXECUTED
-        ["", "", "MOVE", "-2"],  # Row 12:     Move -2 - NOT EXECUTED
-        ["ELSE"],  # Row 13: Outer ELSE
-        ["", "MOVE", "-1"],  # Row 14:   Move -1 (outer else) - EXECUTED
-    ]
-
-    result = await engine_workflow(capture_messages, grid)
+
+    result = await engine_workflow(capture_messages, GRID_NESTED_OUTER_FALSE)
 
     assert result["success"] is True
     # Path: Outer FALSE -> Outer ELSE only
@@ -84,33 +163,10 @@ async def test_triple_nested_if_else_outer_false():
 
 
 @pytest.mark.asyncio
-async def test_triple_nested_if_else_middle_false():
+async def test_triple_nested_if_else_middle_false(capture_messages):
     """Test 3 nested IF-ELSE with outer TRUE, middle FALSE."""
-    messages = []
-
-    async def capture_messages(msg, level):
-        messages.append(msg)
-
-    # Outer IF TRUE -> Middle IF FALSE -> Middle ELSE
-    grid = [
-        ["SET", "A", "10"],  # Row 0: A = 10
-        ["SET", "B", "2"],  # Row 1: B = 2
-        ["SET", "C", "3"],  # Row 2: C = 3
-        ["IF", "A", ">", "5"],  # Row 3: Outer IF (10 > 5 = TRUE)
-        ["", "MOVE", "1"],  # Row 4:   Move 1 (outer then)
-        ["", "IF", "B", ">", "3"],  # Row 5:   Middle IF (2 > 3 = FALSE)
-        ["", "", "MOVE", "2"],  # Row 6:     Move 2 (middle then) - NOT EXECUTED
-        ["", "", "IF", "C", ">", "2"],  # Row 7:     Inner IF - NOT EXECUTED
-        ["", "", "", "MOVE", "3"],  # Row 8:       Move 3 - NOT EXECUTED
-        ["", "", "ELSE"],  # Row 9:     Inner ELSE - NOT EXECUTED
-        ["", "", "", "MOVE", "-3"],  # Row 10:      Move -3 - NOT EXECUTED
-        ["", "ELSE"],  # Row 11:   Middle ELSE
-        ["", "", "MOVE", "-2"],  # Row 12:     Move -2 (middle else)
-        ["ELSE"],  # Row 13: Outer ELSE - NOT EXECUTED
-        ["", "MOVE", "-1"],  # Row 14:   Move -1 - NOT EXECUTED
-    ]
-
-    result = await engine_workflow(capture_messages, grid)
+
+    result = await engine_workflow(capture_messages, GRID_NESTED_MIDDLE_FALSE)
 
     assert result["success"] is True
     # Path: Outer TRUE -> Middle FALSE -> Middle ELSE
@@ -120,33 +176,10 @@ async def test_triple_nested_if_else_middle_false():
 
 
 @pytest.mark.asyncio
-async def test_triple_nested_if_else_inner_false():
+async def test_triple_nested_if_else_inner_false(capture_messages):
     """Test 3 nested IF-ELSE with outer TRUE, middle TRUE, inner FALSE."""
-    messages = []
-
-    async def capture_messages(msg, level):
-        messages.append(msg)
-
-    # Outer IF TRUE -> Middle IF TRUE -> Inner IF FALSE -> Inner ELSE
-    grid = [
-        ["SET", "A", "10"],  # Row 0: A = 10
-        ["SET", "B", "5"],  # Row 1: B = 5
-        ["SET", "C", "1"],  # Row 2: C = 1
-        ["IF", "A", ">", "5"],  # Row 3: Outer IF (10 > 5 = TRUE)
-        ["", "MOVE", "1"],  # Row 4:   Move 1 (outer then)
-        ["", "IF", "B", ">", "3"],  # Row 5:   Middle IF (5 > 3 = TRUE)
-        ["", "", "MOVE", "2"],  # Row 6:     Move 2 (middle then)
-        ["", "", "IF", "C", ">", "2"],  # Row 7:     Inner IF (1 > 2 = FALSE)
-        ["", "", "", "MOVE", "3"],  # Row 8:       Move 3 (inner then) - NOT EXECUTED
-        ["", "", "ELSE"],  # Row 9:     Inner ELSE
-        ["", "", "", "MOVE", "-3"],  # Row 10:      Move -3 (inner else)
-        ["", "ELSE"],  # Row 11:   Middle ELSE - NOT EXECUTED
-        ["", "", "MOVE", "-2"],  # Row 12:     Move -2 - NOT EXECUTED
-        ["ELSE"],  # Row 13: Outer ELSE - NOT EXECUTED
-        ["", "MOVE", "-1"],  # Row 14:   Move -1 - NOT EXECUTED
-    ]
-
-    result = await engine_workflow(capture_messages, grid)
+
+    result = await engine_workflow(capture_messages, GRID_NESTED_INNER_FALSE)
 
     assert result["success"] is True
     # Path: Outer TRUE -> Middle TRUE -> Inner FALSE -> Inner ELSE
@@ -156,34 +189,10 @@ async def test_triple_nested_if_else_inner_false():
 
 
 @pytest.mark.asyncio
-async def test_triple_nested_if_else_with_variables():
+async def test_triple_nested_if_else_with_variables(capture_messages):
     """Test 3 nested IF-ELSE with variable modifications in each branch."""
-    messages = []
-
-    async def capture_messages(msg, level):
-        messages.append(msg)
-
-    # Test that variables are properly modified in the correct branches
-    grid = [
-        ["SET", "RESULT", "0"],  # Row 0: RESULT = 0
-        ["SET", "A", "10"],  # Row 1: A = 10
-        ["SET", "B", "5"],  # Row 2: B = 5
-        ["SET", "C", "3"],  # Row 3: C = 3
-        ["IF", "A", ">", "5"],  # Row 4: Outer IF (10 > 5 = TRUE)
-        ["", "SET", "RESULT", "RESULT", "+", "100"],  # Row 5:   RESULT += 100
-        ["", "IF", "B", ">", "3"],  # Row 6:   Middle IF (5 > 3 = TRUE)
-        ["", "", "SET", "RESULT", "RESULT", "+", "10"],  # Row 7:     RESULT += 10
-        ["", "", "IF", "C", ">", "2"],  # Row 8:     Inner IF (3 > 2 = TRUE)
-        ["", "", "", "SET", "RESULT", "RESULT", "+", "1"],  # Row 9:       RESULT += 1
-        ["", "", "ELSE"],  # Row 10:    Inner ELSE
-        ["", "", "", "SET", "RESULT", "RESULT", "-", "1"],  # Row 11:      RESULT -= 1
-        ["", "ELSE"],  # Row 12:   Middle ELSE
-        ["", "", "SET", "RESULT", "RESULT", "-", "10"],  # Row 13:     RESULT -= 10
-        ["ELSE"],  # Row 14: Outer ELSE
-        ["", "SET", "RESULT", "RESULT", "-", "100"],  # Row 15:   RESULT -= 100
-    ]
-
-    result = await engine_workflow(capture_messages, grid)
+
+    result = await engine_workflow(capture_messages, GRID_NESTED_VARIABLES)
 
     assert result["success"] is True
     # Path: Outer TRUE -> Middle TRUE -> Inner TRUE
@@ -192,30 +201,11 @@ async def test_triple_nested_if_else_with_variables():
 
 
 @pytest.mark.asyncio
-async def test_triple_nested_if_else_parse_structure():
+async def test_triple_nested_if_else_parse_structure(capture_messages):
     """Test that the parser correctly structures 3 nested IF-ELSE commands."""
-    messages = []
-
-    async def capture_messages(msg, level):
-        messages.append(msg)
-
-    grid = [
-        ["IF", "TRUE"],  # Row 0: Outer IF
-        ["", "MOVE", "1"],  # Row 1:   Outer then
-        ["", "IF", "TRUE"],  # Row 2:   Middle IF
-        ["", "", "MOVE", "2"],  # Row 3:     Middle then
-        ["", "", "IF", "TRUE"],  # Row 4:     Inner IF
-        ["", "", "", "MOVE", "3"],  # Row 5:       Inner then
-        ["", "", "ELSE"],  # Row 6:     Inner ELSE
-        ["", "", "", "MOVE", "-3"],  # Row 7:       Inner else
-        ["", "ELSE"],  # Row 8:   Middle ELSE
-        ["", "", "MOVE", "-2"],  # Row 9:     Middle else
-        ["ELSE"],  # Row 10: Outer ELSE
-        ["", "MOVE", "-1"],  # Row 11:   Outer else
-    ]
 
     # Parse and examine the structure
-    parser = GridParser(grid)
+    parser = GridParser(GRID_NESTED_PARSE_STRUCTURE)
     commands = parser.parse()
 
     # Should have one top-level command (outer IF)
@@ -247,20 +237,15 @@ async def test_triple_nested_if_else_parse_structure():
     assert len(inner_if.else_commands) == 1  # Inner ELSE has MOVE -3
 
     # Execute to verify behavior
-    result = await engine_workflow(capture_messages, grid)
+    result = await engine_workflow(capture_messages, GRID_NESTED_PARSE_STRUCTURE)
     assert result["success"] is True
     # All TRUE: 1 + 2 + 3 = 6
     assert result["final_state"]["position"]["y"] == 6
 
 
 @pytest.mark.asyncio
-async def test_triple_nested_if_else_with_sensors():
+async def test_triple_nested_if_else_with_sensors(capture_messages):
     """Test 3 nested IF-ELSE using sensor values."""
-    messages = []
-
-    async def capture_messages(msg, level):
-        messages.append(msg)
-
     # Build commands manually to control sensor values
     sensors = MockSensors()
     sensors.distance = 15.0  # Will trigger obstacle detection (< 30)
@@ -332,27 +317,10 @@ async def test_triple_nested_if_else_with_sensors():
 
 
 @pytest.mark.asyncio
-async def test_complex_nested_structure_with_loops():
+async def test_complex_nested_structure_with_loops(capture_messages):
     """Test nested IF-ELSE combined with loops."""
-    messages = []
-
-    async def capture_messages(msg, level):
-        messages.append(msg)
-
-    grid = [
-        ["SET", "COUNT", "0"],  # Row 0: COUNT = 0
-        ["IF", "TRUE"],  # Row 1: Outer IF
-        ["", "LOOP", "2"],  # Row 2:   Loop 2 times
-        ["", "", "IF", "COUNT", "<", "1"],  # Row 3:     Inner IF
-        ["", "", "", "MOVE", "1"],  # Row 4:       Move 1
-        ["", "", "", "SET", "COUNT", "COUNT", "+", "1"],  # Row 5:  COUNT++
-        ["", "", "ELSE"],  # Row 6:     Inner ELSE
-        ["", "", "", "MOVE", "2"],  # Row 7:       Move 2
-        ["ELSE"],  # Row 8: Outer ELSE
-        ["", "MOVE", "-5"],  # Row 9:   Move -5
-    ]
-
-    result = await engine_workflow(capture_messages, grid)
+
+    result = await engine_workflow(capture_messages, GRID_NESTED_WITH_LOOPS)
 
     assert result["success"] is True
     # Loop iteration 1: COUNT=0 < 1 (TRUE) -> MOVE 1, COUNT=1
@@ -39,13 +39,17 @@ class Direction(Enum):
     @property
     def degrees(self) -> float:
         """Get rotation degrees for turn directions."""
-        if self == Direction.LEFT:
-            return -90
-        elif self == Direction.RIGHT:
-            return 90
-        elif self == Direction.BACKWARD:
-            return 180
-        return 0
+        return _TURN_DEGREES[self]
+
+
+# Built once after the enum exists; a dict probe instead of a branch
+# chain on every degrees lookup
+_TURN_DEGREES = {
+    Direction.FORWARD: 0,
+    Direction.BACKWARD: 180,
+    Direction.LEFT: -90,
+    Direction.RIGHT: 90,
+}
 
 
 class ValueType(Enum):
@@ -90,7 +94,7 @@ class OperatorType(Enum):
     DIVIDE = "/"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
     """2D position in the car's coordinate system."""
 
@@ -104,7 +108,7 @@ class Position:
         return Position(self.x - other.x, self.y - other.y)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GridPosition:
     """Position in the grid (row, col)."""
 
@@ -119,3 +123,7 @@ class GridPosition:
 
 # Type aliases
 Number: TypeAlias = Union[int, float]
+
+# Runtime counterpart of Number for isinstance checks; a shared constant
+# so hot paths don't rebuild the tuple on every call
+NUMBER_TYPES: tuple[type, ...] = (int, float)
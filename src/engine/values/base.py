@@ -1,41 +1,62 @@
-from abc import ABC, abstractmethod
+from functools import lru_cache
 
 from ..types import Number
 from ..context import ExecutionContext
 
 
-class Value(ABC):
-    """Abstract base class for all values."""
+# Characters a numeric token can start with; checked before attempting
+# int()/float() so non-numeric tokens skip the exception round-trip
+_NUM_START = frozenset("+-.0123456789")
 
-    @abstractmethod
-    async def evaluate(self, context: ExecutionContext) -> Number | bool | str:
-        """Evaluate the value in the given context."""
-        pass
+# Keyword vocabularies, built once for O(1) membership checks
+_BOOLEAN_NAMES = frozenset(("TRUE", "FALSE"))
+_DIRECTION_NAMES = frozenset(("LEFT", "RIGHT", "FORWARD", "BACKWARD"))
+_SENSOR_NAMES = frozenset(("DISTANCE", "OBSTACLE", "BLACK_DETECTED", "BLACK_LOST"))
 
-    @abstractmethod
-    def __repr__(self) -> str:
-        """String representation for debugging."""
-        pass
 
+class Value:
+    """Abstract base class for all values.
 
-class ValueParser:
-    """Parser for converting tokens to Value objects."""
+    A plain class rather than abc.ABC: Values are allocated for every
+    parsed token, and ABCMeta adds measurable overhead to each
+    instantiation for enforcement the engine never relies on. Subclasses
+    must override both methods; the bases raise if they are reached.
+    """
 
-    @staticmethod
-    def parse(token: str) -> Value | None:
-        """Parse a token into a Value object.
+    __slots__ = ()
 
-        Returns None if the token is not a recognized value.
-        """
-        from .types import (
-            NumberValue,
-            VariableValue,
-            SensorValue,
-            DirectionValue,
-            BooleanValue,
-        )
-
-        # Try to parse as number
+    async def evaluate(self, context: ExecutionContext) -> Number | bool | str:
+        """Evaluate the value in the given context."""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        raise NotImplementedError
+
+
+@lru_cache(maxsize=1024)
+def _parse_token(token: str) -> Value | None:
+    """Parse a token into a Value, caching per unique token string.
+
+    Grids repeat the same handful of tokens ("1", "TRUE", variable
+    names) across cells and re-parse them on every expression scan;
+    caching returns the already-built Value instead. Sharing instances
+    is safe because Values are never mutated after construction.
+    """
+    # Imported here (not at module scope) because types.py imports
+    # Value from this module; only runs on a cache miss anyway
+    from .types import (
+        NumberValue,
+        VariableValue,
+        SensorValue,
+        DirectionValue,
+        BooleanValue,
+    )
+
+    # Try to parse as number; most tokens are keywords or identifiers,
+    # so only attempt the conversion when the first character could
+    # start a number
+    if token and token[0] in _NUM_START:
         try:
             if "." in token:
                 return NumberValue(float(token))
@@ -44,29 +65,41 @@ class ValueParser:
         except ValueError:
             pass
 
-        # Check for special values
-        token_upper = token.upper()
+    # Check for special values
+    token_upper = token.upper()
+
+    # Boolean values
+    if token_upper in _BOOLEAN_NAMES:
+        return BooleanValue(token_upper == "TRUE")
+
+    # Direction values
+    if token_upper in _DIRECTION_NAMES:
+        return DirectionValue(token_upper)
 
-        # Boolean values
-        if token_upper in ("TRUE", "FALSE"):
-            return BooleanValue(token_upper == "TRUE")
+    # Sensor values
+    if token_upper in _SENSOR_NAMES:
+        return SensorValue(token_upper)
 
-        # Direction values
-        if token_upper in ("LEFT", "RIGHT", "FORWARD", "BACKWARD"):
-            return DirectionValue(token_upper)
+    # Variable values - any valid identifier that's not a command
+    # Allow alphanumeric characters and underscores, but must start with letter or underscore
+    if (
+        token
+        and (token[0].isalpha() or token[0] == "_")
+        and all(c.isalnum() or c == "_" for c in token)
+    ):
+        return VariableValue(token_upper)
 
-        # Sensor values
-        if token_upper in ("DISTANCE", "OBSTACLE", "BLACK_DETECTED", "BLACK_LOST"):
-            return SensorValue(token_upper)
+    # Not a recognized value
+    return None
 
-        # Variable values - any valid identifier that's not a command
-        # Allow alphanumeric characters and underscores, but must start with letter or underscore
-        if (
-            token
-            and (token[0].isalpha() or token[0] == "_")
-            and all(c.isalnum() or c == "_" for c in token)
-        ):
-            return VariableValue(token_upper)
 
-        # Not a recognized value
-        return None
+class ValueParser:
+    """Parser for converting tokens to Value objects."""
+
+    @staticmethod
+    def parse(token: str) -> Value | None:
+        """Parse a token into a Value object.
+
+        Returns None if the token is not a recognized value.
+        """
+        return _parse_token(token)
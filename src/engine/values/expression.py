@@ -1,20 +1,74 @@
 """Expression evaluation for arithmetic and logical operations."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 import logging
+import operator
 from core.types import LogLevel
 
 from .base import Value, ValueParser
-from ..types import Number, OperatorType
+from .types import NumberValue, BooleanValue
+from ..types import Number, OperatorType, NUMBER_TYPES
 from ..context import ExecutionContext
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Literal leaf types whose evaluation is just an attribute read; reading
+# .value directly skips the coroutine round-trip per operand
+_LITERAL_TYPES = (NumberValue, BooleanValue)
+
+# Operator lookup tables for the parser scans, built once at import
+# instead of tuple literals and dict literals inside the scan loops
+_LOGICAL_OPS = {
+    "AND": OperatorType.AND,
+    "OR": OperatorType.OR,
+}
+_COMPARISON_OPS = {
+    "<": OperatorType.LESS_THAN,
+    "<=": OperatorType.LESS_EQUAL,
+    ">": OperatorType.GREATER_THAN,
+    ">=": OperatorType.GREATER_EQUAL,
+    "=": OperatorType.EQUAL,
+    "==": OperatorType.EQUAL,
+    "!=": OperatorType.NOT_EQUAL,
+}
+_ARITHMETIC_OPS = {
+    "+": OperatorType.ADD,
+    "-": OperatorType.SUBTRACT,
+    "*": OperatorType.MULTIPLY,
+    "/": OperatorType.DIVIDE,
+}
+
+# Evaluation dispatch: one dict lookup to a C-implemented callable
+# replaces the old 10-arm if/elif cascade of enum comparisons.
+# Operators here coerce both operands through _to_number first
+_NUMERIC_FUNCS = {
+    OperatorType.ADD: operator.add,
+    OperatorType.SUBTRACT: operator.sub,
+    OperatorType.MULTIPLY: operator.mul,
+    OperatorType.DIVIDE: operator.truediv,
+    OperatorType.LESS_THAN: operator.lt,
+    OperatorType.LESS_EQUAL: operator.le,
+    OperatorType.GREATER_THAN: operator.gt,
+    OperatorType.GREATER_EQUAL: operator.ge,
+}
+# These compare the raw evaluated values without numeric coercion
+_EQUALITY_FUNCS = {
+    OperatorType.EQUAL: operator.eq,
+    OperatorType.NOT_EQUAL: operator.ne,
+}
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Expression(Value):
-    """An expression combining values with operators."""
+    """An expression combining values with operators.
+
+    eq=False: dataclass equality would walk the whole tree recursively,
+    and nothing compares expressions by structure - the parse cache
+    interns trees, so identity comparison (the object default) is both
+    correct and constant-time. Leaf values keep structural equality.
+    """
 
     left: Value
     operator: OperatorType
@@ -22,155 +76,116 @@ class Expression(Value):
 
     async def evaluate(self, context: ExecutionContext) -> Number | bool:
         """Evaluate the expression."""
-        if context.send_message:
+        if context.debug_enabled and context.send_message:
             await context.send_message(
                 f"🧮 Expression.evaluate() starting: {self}", LogLevel.DEBUG
             )
 
-        # Evaluate operands
-        left_val = await self.left.evaluate(context)
-        if context.send_message:
-            await context.send_message(
-                f"   ↳ Left operand: {self.left} → {left_val}", LogLevel.DEBUG
-            )
-
-        right_val = await self.right.evaluate(context) if self.right else None
-        if self.right and context.send_message:
-            await context.send_message(
-                f"   ↳ Right operand: {self.right} → {right_val}", LogLevel.DEBUG
-            )
+        # Evaluate operands; literal leaves are read directly instead of
+        # awaiting their evaluate coroutine (and skip the per-operand
+        # debug message - the operator message below still shows both)
+        if isinstance(self.left, _LITERAL_TYPES):
+            left_val = self.left.value
+        else:
+            left_val = await self.left.evaluate(context)
+            if context.debug_enabled and context.send_message:
+                await context.send_message(
+                    f"   ↳ Left operand: {self.left} → {left_val}", LogLevel.DEBUG
+                )
 
         # Unary operators
         if self.operator == OperatorType.NOT:
             result = not bool(left_val)
-            if context.send_message:
+            if context.debug_enabled and context.send_message:
                 await context.send_message(
                     f"   ↳ NOT {left_val} = {result}", LogLevel.DEBUG
                 )
             return result
 
         # Binary operators require right operand
-        if right_val is None:
+        if self.right is None:
             raise ValueError(f"Binary operator {self.operator} requires right operand")
 
-        # Arithmetic operators - ensure numeric types
-        if self.operator in (
-            OperatorType.ADD,
-            OperatorType.SUBTRACT,
-            OperatorType.MULTIPLY,
-            OperatorType.DIVIDE,
-        ):
-            # Convert to numeric values
-            left_num = self._to_number(left_val)
-            right_num = self._to_number(right_val)
-
-            if self.operator == OperatorType.ADD:
-                result = left_num + right_num
-                if context.send_message:
-                    await context.send_message(
-                        f"   ↳ {left_num} + {right_num} = {result}", LogLevel.DEBUG
-                    )
-                return result
-            elif self.operator == OperatorType.SUBTRACT:
-                result = left_num - right_num
-                if context.send_message:
-                    await context.send_message(
-                        f"   ↳ {left_num} - {right_num} = {result}", LogLevel.DEBUG
-                    )
-                return result
-            elif self.operator == OperatorType.MULTIPLY:
-                result = left_num * right_num
-                if context.send_message:
-                    await context.send_message(
-                        f"   ↳ {left_num} * {right_num} = {result}", LogLevel.DEBUG
-                    )
-                return result
-            elif self.operator == OperatorType.DIVIDE:
-                if right_num == 0:
-                    raise ValueError("Division by zero")
-                result = left_num / right_num
-                if context.send_message:
-                    await context.send_message(
-                        f"   ↳ {left_num} / {right_num} = {result}", LogLevel.DEBUG
-                    )
-                return result
-
-        # Comparison operators - work with numeric values
-        elif self.operator in (
-            OperatorType.LESS_THAN,
-            OperatorType.LESS_EQUAL,
-            OperatorType.GREATER_THAN,
-            OperatorType.GREATER_EQUAL,
-        ):
-            left_num = self._to_number(left_val)
-            right_num = self._to_number(right_val)
-
-            if self.operator == OperatorType.LESS_THAN:
-                result = left_num < right_num
-                if context.send_message:
-                    await context.send_message(
-                        f"   ↳ {left_num} < {right_num} = {result}", LogLevel.DEBUG
-                    )
-                return result
-            elif self.operator == OperatorType.LESS_EQUAL:
-                result = left_num <= right_num
-                if context.send_message:
-                    await context.send_message(
-                        f"   ↳ {left_num} <= {right_num} = {result}", LogLevel.DEBUG
-                    )
-                return result
-            elif self.operator == OperatorType.GREATER_THAN:
-                result = left_num > right_num
-                if context.send_message:
-                    await context.send_message(
-                        f"   ↳ {left_num} > {right_num} = {result}", LogLevel.DEBUG
-                    )
-                return result
-            elif self.operator == OperatorType.GREATER_EQUAL:
-                result = left_num >= right_num
-                if context.send_message:
+        # Logical operators short-circuit: the right operand (which may be
+        # a sensor read) is only evaluated when the left side doesn't
+        # already decide the result
+        if self.operator == OperatorType.AND:
+            if not left_val:
+                if context.debug_enabled and context.send_message:
                     await context.send_message(
-                        f"   ↳ {left_num} >= {right_num} = {result}", LogLevel.DEBUG
+                        f"   ↳ {left_val} AND … → False (short-circuit)",
+                        LogLevel.DEBUG,
                     )
-                return result
-
-        # Equality operators - work with any type
-        elif self.operator == OperatorType.EQUAL:
-            result = left_val == right_val
-            if context.send_message:
+                return False
+            right_val = await self._evaluate_right(context)
+            result = bool(right_val)
+            if context.debug_enabled and context.send_message:
                 await context.send_message(
-                    f"   ↳ {left_val} = {right_val} → {result}", LogLevel.DEBUG
+                    f"   ↳ {left_val} AND {right_val} → {result}", LogLevel.DEBUG
                 )
             return result
-        elif self.operator == OperatorType.NOT_EQUAL:
-            result = left_val != right_val
-            if context.send_message:
+        elif self.operator == OperatorType.OR:
+            if left_val:
+                if context.debug_enabled and context.send_message:
+                    await context.send_message(
+                        f"   ↳ {left_val} OR … → True (short-circuit)",
+                        LogLevel.DEBUG,
+                    )
+                return True
+            right_val = await self._evaluate_right(context)
+            result = bool(right_val)
+            if context.debug_enabled and context.send_message:
                 await context.send_message(
-                    f"   ↳ {left_val} != {right_val} → {result}", LogLevel.DEBUG
+                    f"   ↳ {left_val} OR {right_val} → {result}", LogLevel.DEBUG
                 )
             return result
 
-        # Logical operators
-        elif self.operator == OperatorType.AND:
-            result = bool(left_val) and bool(right_val)
-            if context.send_message:
+        right_val = await self._evaluate_right(context)
+
+        # Arithmetic and comparison operators - coerce both sides to
+        # numbers, then apply the C-implemented function from the table
+        fn = _NUMERIC_FUNCS.get(self.operator)
+        if fn is not None:
+            left_num = self._to_number(left_val)
+            right_num = self._to_number(right_val)
+            if self.operator is OperatorType.DIVIDE and right_num == 0:
+                raise ValueError("Division by zero")
+            result = fn(left_num, right_num)
+            if context.debug_enabled and context.send_message:
                 await context.send_message(
-                    f"   ↳ {left_val} AND {right_val} → {result}", LogLevel.DEBUG
+                    f"   ↳ {left_num} {self.operator.value} {right_num} = {result}",
+                    LogLevel.DEBUG,
                 )
             return result
-        elif self.operator == OperatorType.OR:
-            result = bool(left_val) or bool(right_val)
-            if context.send_message:
+
+        # Equality operators - work with any type
+        fn = _EQUALITY_FUNCS.get(self.operator)
+        if fn is not None:
+            result = fn(left_val, right_val)
+            if context.debug_enabled and context.send_message:
                 await context.send_message(
-                    f"   ↳ {left_val} OR {right_val} → {result}", LogLevel.DEBUG
+                    f"   ↳ {left_val} {self.operator.value} {right_val} → {result}",
+                    LogLevel.DEBUG,
                 )
             return result
 
         raise ValueError(f"Unknown operator: {self.operator}")
 
+    async def _evaluate_right(self, context: ExecutionContext) -> Number | bool | str:
+        """Evaluate the right operand (literal leaves read directly)."""
+        assert self.right is not None
+        if isinstance(self.right, _LITERAL_TYPES):
+            return self.right.value
+        right_val = await self.right.evaluate(context)
+        if context.debug_enabled and context.send_message:
+            await context.send_message(
+                f"   ↳ Right operand: {self.right} → {right_val}", LogLevel.DEBUG
+            )
+        return right_val
+
     def _to_number(self, value: Any) -> Number:
         """Convert a value to a number."""
-        if isinstance(value, (int, float)):
+        if isinstance(value, NUMBER_TYPES):
             return value
         elif isinstance(value, bool):
             return 1 if value else 0
@@ -188,6 +203,123 @@ class Expression(Value):
         return f"Expression({self.operator.value} {self.left})"
 
 
+def _fold_constant(expr: Expression) -> Value:
+    """Collapse an expression over literal operands into its result.
+
+    Applied at parse time: when every operand is a NumberValue or
+    BooleanValue the result can never change, so loop bodies re-running
+    the expression get a plain literal instead of a tree walk. Anything
+    involving variables or sensors - and division (so a zero divisor
+    still raises at run time) - is returned unchanged.
+    """
+    left = expr.left
+    if not isinstance(left, _LITERAL_TYPES):
+        return expr
+
+    op = expr.operator
+    if op == OperatorType.NOT:
+        return BooleanValue(not bool(left.value))
+
+    right = expr.right
+    if not isinstance(right, _LITERAL_TYPES):
+        return expr
+
+    left_num = int(left.value) if isinstance(left.value, bool) else left.value
+    right_num = int(right.value) if isinstance(right.value, bool) else right.value
+
+    if op == OperatorType.ADD:
+        return NumberValue(left_num + right_num)
+    if op == OperatorType.SUBTRACT:
+        return NumberValue(left_num - right_num)
+    if op == OperatorType.MULTIPLY:
+        return NumberValue(left_num * right_num)
+    if op == OperatorType.LESS_THAN:
+        return BooleanValue(left_num < right_num)
+    if op == OperatorType.LESS_EQUAL:
+        return BooleanValue(left_num <= right_num)
+    if op == OperatorType.GREATER_THAN:
+        return BooleanValue(left_num > right_num)
+    if op == OperatorType.GREATER_EQUAL:
+        return BooleanValue(left_num >= right_num)
+    if op == OperatorType.EQUAL:
+        return BooleanValue(left.value == right.value)
+    if op == OperatorType.NOT_EQUAL:
+        return BooleanValue(left.value != right.value)
+    if op == OperatorType.AND:
+        return BooleanValue(bool(left.value) and bool(right.value))
+    if op == OperatorType.OR:
+        return BooleanValue(bool(left.value) or bool(right.value))
+
+    # DIVIDE (division-by-zero must surface at run time) and anything
+    # unrecognized stay as-is
+    return expr
+
+
+@lru_cache(maxsize=512)
+def _parse_expression(tokens: tuple[str, ...]) -> Value | None:
+    """Parse a cleaned token tuple into an expression tree, with caching.
+
+    Keyed on the token tuple, so the same expression appearing in many
+    grid cells (or re-parsed across runs) builds its tree once. Sharing
+    trees is safe because Values are frozen.
+    """
+    # %-style args defer formatting until a DEBUG handler is active
+    logger.debug("🧮 ExpressionParser.parse_tokens() input: %s", tokens)
+
+    # Single token - try to parse as value
+    if len(tokens) == 1:
+        return ValueParser.parse(tokens[0])
+
+    # Look for logical operators (lowest precedence); keywords are stored
+    # upper-case in the table, so probe as-is before paying for .upper()
+    for i, token in enumerate(tokens):
+        op = _LOGICAL_OPS.get(token) or _LOGICAL_OPS.get(token.upper())
+        if op:
+            left_expr = _parse_expression(tokens[:i])
+            right_expr = _parse_expression(tokens[i + 1 :])
+            if left_expr and right_expr:
+                return _fold_constant(Expression(left_expr, op, right_expr))
+
+    # Look for comparison operators
+    for i, token in enumerate(tokens):
+        op = _COMPARISON_OPS.get(token)
+        if op:
+            left_expr = _parse_expression(tokens[:i])
+            right_expr = _parse_expression(tokens[i + 1 :])
+            if left_expr and right_expr:
+                return _fold_constant(Expression(left_expr, op, right_expr))
+
+    # Look for arithmetic operators
+    for i, token in enumerate(tokens):
+        op = _ARITHMETIC_OPS.get(token)
+        if op:
+            left_expr = _parse_expression(tokens[:i])
+            right_expr = _parse_expression(tokens[i + 1 :])
+            if left_expr and right_expr:
+                return _fold_constant(Expression(left_expr, op, right_expr))
+
+    # Check for unary NOT
+    if tokens[0].upper() == "NOT" and len(tokens) > 1:
+        operand = _parse_expression(tokens[1:])
+        if operand:
+            return _fold_constant(Expression(operand, OperatorType.NOT))
+
+    # Try to parse the whole thing as a value
+    result = ValueParser.parse(" ".join(tokens))
+
+    if result is None:
+        logger.warning("🧮 ExpressionParser failed to parse tokens: %s", tokens)
+        logger.warning(
+            "   ↳ Attempted to parse as single value: '%s'", " ".join(tokens)
+        )
+    else:
+        logger.debug(
+            "🧮 ExpressionParser successfully parsed as single value: %r", result
+        )
+
+    return result
+
+
 class ExpressionParser:
     """Parser for expressions from token lists."""
 
@@ -204,81 +336,9 @@ class ExpressionParser:
         if not tokens:
             return None
 
-        # Remove empty tokens
-        tokens = [t for t in tokens if t.strip()]
-        if not tokens:
+        # Remove empty tokens; the cached parser works on tuples
+        cleaned = tuple(t for t in tokens if t.strip())
+        if not cleaned:
             return None
 
-        logger.debug(f"🧮 ExpressionParser.parse_tokens() input: {tokens}")
-
-        # Debug individual token parsing
-        for i, token in enumerate(tokens):
-            parsed = ValueParser.parse(token)
-            logger.debug(
-                f"   Token[{i}]: '{token}' → {parsed} ({type(parsed).__name__ if parsed else 'None'})"
-            )
-
-        # Single token - try to parse as value
-        if len(tokens) == 1:
-            return ValueParser.parse(tokens[0])
-
-        # Look for logical operators (lowest precedence)
-        for i, token in enumerate(tokens):
-            if token.upper() in ("AND", "OR"):
-                left_expr = ExpressionParser.parse_tokens(tokens[:i])
-                right_expr = ExpressionParser.parse_tokens(tokens[i + 1 :])
-                if left_expr and right_expr:
-                    op = OperatorType.AND if token.upper() == "AND" else OperatorType.OR
-                    return Expression(left_expr, op, right_expr)
-
-        # Look for comparison operators
-        for i, token in enumerate(tokens):
-            if token in ("<", "<=", ">", ">=", "=", "!=", "=="):
-                left_expr = ExpressionParser.parse_tokens(tokens[:i])
-                right_expr = ExpressionParser.parse_tokens(tokens[i + 1 :])
-                if left_expr and right_expr:
-                    op_map = {
-                        "<": OperatorType.LESS_THAN,
-                        "<=": OperatorType.LESS_EQUAL,
-                        ">": OperatorType.GREATER_THAN,
-                        ">=": OperatorType.GREATER_EQUAL,
-                        "=": OperatorType.EQUAL,
-                        "==": OperatorType.EQUAL,
-                        "!=": OperatorType.NOT_EQUAL,
-                    }
-                    return Expression(left_expr, op_map[token], right_expr)
-
-        # Look for arithmetic operators
-        for i, token in enumerate(tokens):
-            if token in ("+", "-", "*", "/"):
-                left_expr = ExpressionParser.parse_tokens(tokens[:i])
-                right_expr = ExpressionParser.parse_tokens(tokens[i + 1 :])
-                if left_expr and right_expr:
-                    op_map = {
-                        "+": OperatorType.ADD,
-                        "-": OperatorType.SUBTRACT,
-                        "*": OperatorType.MULTIPLY,
-                        "/": OperatorType.DIVIDE,
-                    }
-                    return Expression(left_expr, op_map[token], right_expr)
-
-        # Check for unary NOT
-        if tokens[0].upper() == "NOT" and len(tokens) > 1:
-            operand = ExpressionParser.parse_tokens(tokens[1:])
-            if operand:
-                return Expression(operand, OperatorType.NOT)
-
-        # Try to parse the whole thing as a value
-        result = ValueParser.parse(" ".join(tokens))
-
-        if result is None:
-            logger.warning(f"🧮 ExpressionParser failed to parse tokens: {tokens}")
-            logger.warning(
-                f"   ↳ Attempted to parse as single value: '{' '.join(tokens)}'"
-            )
-        else:
-            logger.debug(
-                f"🧮 ExpressionParser successfully parsed as single value: {result}"
-            )
-
-        return result
+        return _parse_expression(cleaned)
@@ -6,14 +6,31 @@ from ..types import Number, SensorType
 from ..context import ExecutionContext
 
 
-@dataclass
+# Built once at import; SensorValue.evaluate previously rebuilt this dict
+# on every call
+_SENSOR_MAP = {
+    "DISTANCE": SensorType.DISTANCE,
+    "OBSTACLE": SensorType.OBSTACLE,
+    "BLACK_DETECTED": SensorType.BLACK_DETECTED,
+    "BLACK_LOST": SensorType.BLACK_LOST,
+}
+
+# Turn directions map to signed degrees; other directions evaluate to
+# their own name (see DirectionValue)
+_DIRECTION_DEGREES = {
+    "LEFT": -90,
+    "RIGHT": 90,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class NumberValue(Value):
     """A numeric constant value."""
 
     value: Number
 
     async def evaluate(self, context: ExecutionContext) -> Number:
-        if context.send_message:
+        if context.debug_enabled and context.send_message:
             await context.send_message(
                 f"🔢 NumberValue.evaluate() → {self.value}", LogLevel.DEBUG
             )
@@ -23,14 +40,14 @@ class NumberValue(Value):
         return f"NumberValue({self.value})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BooleanValue(Value):
     """A boolean constant value."""
 
     value: bool
 
     async def evaluate(self, context: ExecutionContext) -> bool:
-        if context.send_message:
+        if context.debug_enabled and context.send_message:
             await context.send_message(
                 f"🔘 BooleanValue.evaluate() → {self.value}", LogLevel.DEBUG
             )
@@ -40,7 +57,7 @@ class BooleanValue(Value):
         return f"BooleanValue({self.value})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VariableValue(Value):
     """A variable reference."""
 
@@ -48,7 +65,7 @@ class VariableValue(Value):
 
     async def evaluate(self, context: ExecutionContext) -> Number | bool:
         value = context.get_variable(self.name)
-        if context.send_message:
+        if context.debug_enabled and context.send_message:
             await context.send_message(
                 f"📦 VariableValue.evaluate({self.name}) → {value}", LogLevel.DEBUG
             )
@@ -58,24 +75,21 @@ class VariableValue(Value):
         return f"VariableValue({self.name})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SensorValue(Value):
     """A sensor reading value."""
 
     sensor_name: str
 
     async def evaluate(self, context: ExecutionContext) -> Number | bool:
-        sensor_map = {
-            "DISTANCE": SensorType.DISTANCE,
-            "OBSTACLE": SensorType.OBSTACLE,
-            "BLACK_DETECTED": SensorType.BLACK_DETECTED,
-            "BLACK_LOST": SensorType.BLACK_LOST,
-        }
-
-        sensor_type = sensor_map.get(self.sensor_name.upper())
+        # The parser stores names upper-cased, so probe as-is first and
+        # only pay for .upper() on the unusual path
+        sensor_type = _SENSOR_MAP.get(self.sensor_name) or _SENSOR_MAP.get(
+            self.sensor_name.upper()
+        )
         if sensor_type:
             value = await context.get_sensor_value(sensor_type)
-            if context.send_message:
+            if context.debug_enabled and context.send_message:
                 await context.send_message(
                     f"🔍 SensorValue.evaluate({self.sensor_name}) → {value}",
                     LogLevel.DEBUG,
@@ -88,23 +102,18 @@ class SensorValue(Value):
         return f"SensorValue({self.sensor_name})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DirectionValue(Value):
     """A direction value (LEFT, RIGHT, etc.)."""
 
     direction_name: str
 
     async def evaluate(self, context: ExecutionContext) -> str | Number:
-        # For turns, LEFT and RIGHT map to degrees
-        if self.direction_name == "LEFT":
-            value = -90
-        elif self.direction_name == "RIGHT":
-            value = 90
-        else:
-            # For other uses, return the direction name
-            value = self.direction_name
-
-        if context.send_message:
+        # For turns, LEFT and RIGHT map to degrees; other directions
+        # return their name
+        value = _DIRECTION_DEGREES.get(self.direction_name, self.direction_name)
+
+        if context.debug_enabled and context.send_message:
             await context.send_message(
                 f"🧭 DirectionValue.evaluate({self.direction_name}) → {value}",
                 LogLevel.DEBUG,
@@ -1,14 +1,28 @@
-from typing import Callable, Awaitable, Any
+from functools import lru_cache
+from typing import Callable, Awaitable, Any, Sequence
 from core.types import LogLevel
 
+from .commands import Command
 from .parser import GridParser
 from .executor import Executor
 from .hardware import MockHardware, CarHardware
 
 
+@lru_cache(maxsize=32)
+def _parse_grid_cached(grid_key: tuple[tuple[str, ...], ...]) -> list[Command]:
+    """Parse a grid, caching the command tree per unique grid.
+
+    Re-running the same program (common when iterating on a block layout,
+    and in tests) skips the full GridParser pass. Safe to share because
+    command trees are never mutated after parsing - execution only
+    touches the ExecutionContext.
+    """
+    return GridParser([list(row) for row in grid_key]).parse()
+
+
 async def engine_workflow(
     send_message: Callable[[str, LogLevel], Awaitable[None]],
-    grid_data: list[list[str]] | None = None,
+    grid_data: Sequence[Sequence[str]] | None = None,
     use_hardware: bool = False,
 ) -> dict[str, Any]:
     """Process a grid and execute the resulting program.
@@ -34,8 +48,9 @@ async def engine_workflow(
             },
         }
 
-    # Check if grid is empty
-    is_empty = all(all(cell.strip() == "" for cell in row) for row in grid_data)
+    # Check if grid is empty: a single flat scan that stops at the first
+    # non-blank cell, without allocating a stripped copy per cell
+    is_empty = not any(cell and not cell.isspace() for row in grid_data for cell in row)
 
     if is_empty:
         await send_message("ℹ️ Grid is empty - no commands to execute", LogLevel.INFO)
@@ -53,28 +68,42 @@ async def engine_workflow(
         }
 
     try:
-        # Display grid
-        await send_message("\n📊 Grid contents:", LogLevel.INFO)
-        for i, row in enumerate(grid_data):
-            row_str = " | ".join(
-                cell if cell else "___" for cell in row[:10]
-            )  # Show first 10 cols
-            await send_message(f"Row {i:2d}: {row_str}", LogLevel.DEBUG)
-
-        # Parse grid into commands
+        # The grid and command-structure displays are diagnostics. A
+        # callback that drops DEBUG messages can opt out of their
+        # formatting cost entirely by setting debug_enabled = False on
+        # itself; by default everything is sent and the message pipeline
+        # does its own level filtering.
+        debug_display = getattr(send_message, "debug_enabled", True)
+
+        if debug_display:
+            # Display grid - batched into a single message to avoid one
+            # await/websocket round-trip per row
+            await send_message("\n📊 Grid contents:", LogLevel.INFO)
+            grid_lines = [
+                "Row {:2d}: {}".format(
+                    i, " | ".join(cell if cell else "___" for cell in row[:10])
+                )  # Show first 10 cols
+                for i, row in enumerate(grid_data)
+            ]
+            await send_message("\n".join(grid_lines), LogLevel.DEBUG)
+
+        # Parse grid into commands (cached per unique grid)
         await send_message("\n🔍 Parsing grid into commands...", LogLevel.INFO)
-        parser = GridParser(grid_data)
-        commands = parser.parse()
+        commands = _parse_grid_cached(tuple(tuple(row) for row in grid_data))
 
         await send_message(
             f"✅ Parsed {len(commands)} top-level commands", LogLevel.SUCCESS
         )
 
-        # Display parsed commands
-        await send_message("\n📝 Command structure:", LogLevel.INFO)
-        for i, cmd in enumerate(commands):
-            await send_message(f"  {i+1}. {cmd}", LogLevel.DEBUG)
-            _display_nested_commands(cmd, send_message, "    ")
+        if debug_display:
+            # Display parsed commands - batched like the grid display, so
+            # the structure costs one await instead of one per command
+            await send_message("\n📝 Command structure:", LogLevel.INFO)
+            cmd_lines = []
+            for i, cmd in enumerate(commands):
+                cmd_lines.append(f"  {i+1}. {cmd}")
+                cmd_lines.extend(_command_tree_lines(cmd, "    "))
+            await send_message("\n".join(cmd_lines), LogLevel.DEBUG)
 
         # Execute commands
         await send_message("\n⚡ Executing commands...", LogLevel.INFO)
@@ -107,8 +136,13 @@ async def engine_workflow(
 
         if final_state["variables"]:
             await send_message("\n📊 Variables:", LogLevel.INFO)
-            for var, value in final_state["variables"].items():
-                await send_message(f"  {var} = {value}", LogLevel.DEBUG)
+            await send_message(
+                "\n".join(
+                    f"  {var} = {value}"
+                    for var, value in final_state["variables"].items()
+                ),
+                LogLevel.DEBUG,
+            )
 
         if final_state["path"]:
             await send_message(
@@ -138,18 +172,34 @@ async def engine_workflow(
         }
 
 
-def _display_nested_commands(command: Any, send_message_sync: Any, indent: str) -> None:
-    """Helper to display nested commands (synchronous)."""
-    if hasattr(command, "nested_commands"):
-        for nested in command.nested_commands:
-            # Note: This is a simplified sync version for display
-            # In a real async context, we'd need to make this async
-            print(f"{indent}{nested}")
-            _display_nested_commands(nested, send_message_sync, indent + "  ")
-
-    # Show ELSE block for IF commands
-    if hasattr(command, "else_commands") and command.else_commands:
-        print(f"{indent}ELSE:")
-        for else_cmd in command.else_commands:
-            print(f"{indent}  {else_cmd}")
-            _display_nested_commands(else_cmd, send_message_sync, indent + "    ")
+def _command_tree_lines(command: Any, indent: str) -> list[str]:
+    """Render a command's nested structure (including ELSE blocks) as lines.
+
+    Iterative with an explicit stack rather than one Python frame per
+    nesting level; the caller joins the lines into a single message.
+    """
+    lines: list[str] = []
+    # Stack items are either a finished line (str) or a (command, indent)
+    # pair whose children still need expanding
+    stack: list[str | tuple[Any, str]] = [(command, indent)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            lines.append(item)
+            continue
+
+        cmd, ind = item
+        pending: list[str | tuple[Any, str]] = []
+        for nested in getattr(cmd, "nested_commands", ()):
+            pending.append(f"{ind}{nested}")
+            pending.append((nested, ind + "  "))
+
+        # Show ELSE block for IF commands
+        if getattr(cmd, "else_commands", None):
+            pending.append(f"{ind}ELSE:")
+            for else_cmd in cmd.else_commands:
+                pending.append(f"{ind}  {else_cmd}")
+                pending.append((else_cmd, ind + "    "))
+
+        stack.extend(reversed(pending))
+    return lines